@@ -0,0 +1,434 @@
+# Async serving mode: the /<table_name> CRUD routes and the report queries on
+# SQLAlchemy's asyncio engine (asyncpg) behind aiohttp, so one process keeps many
+# requests in flight while they wait on the database. Independent reports run
+# concurrently on separate connections instead of one after another.
+#
+#   python async_app.py --port 5001
+#   GET /reports?names=6.1,6.2,6.3,6.4
+import argparse
+import asyncio
+import datetime
+import decimal
+import json
+import os
+from email.utils import format_datetime
+
+from aiohttp import web
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app as sync_app
+
+ASYNC_DB_URL = os.environ.get(
+    "ASYNC_DB_URL", sync_app.DB_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+)
+ASYNC_POOL_SIZE = int(os.environ.get("ASYNC_POOL_SIZE", "20"))
+ASYNC_MAX_OVERFLOW = int(os.environ.get("ASYNC_MAX_OVERFLOW", "20"))
+
+# asyncpg caps a statement at 32767 bind parameters, which bounds multi-row INSERT chunks
+MAX_BIND_PARAMS = 32767
+
+async_engine = create_async_engine(ASYNC_DB_URL, pool_size=ASYNC_POOL_SIZE, max_overflow=ASYNC_MAX_OVERFLOW)
+
+
+def _json_default(value):
+    # same encoding as the Flask routes: Decimal as string, dates/times as ISO 8601
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data):
+    return json.dumps(data, default=_json_default, sort_keys=True)
+
+
+def _json_response(data, status=200, headers=None):
+    return web.Response(text=_dumps(data), status=status, headers=headers, content_type="application/json")
+
+
+# REPORTS
+async def run_report_async(name, **params):
+    stmt = sync_app.REPORT_QUERIES[name](sync_app._reflect_tables(), **params)
+    async with async_engine.connect() as conn:
+        return (await conn.execute(stmt)).all()
+
+
+async def run_reports_async(names):
+    # each report gets its own connection, so they overlap in the database
+    results = await asyncio.gather(*(run_report_async(name) for name in names))
+    return dict(zip(names, results))
+
+
+async def selects_5_x_async():
+    return await run_reports_async(["5.1", "5.2", "5.3", "5.4"])
+
+
+async def queries_6_x_async():
+    return await run_reports_async(["6.1", "6.2", "6.3", "6.4"])
+
+
+async def reports_handler(request):
+    names = [n for n in request.query.get("names", "").split(",") if n] or list(sync_app.REPORT_QUERIES)
+    unknown = [n for n in names if n not in sync_app.REPORT_QUERIES]
+    if unknown:
+        return _json_response({"error": f"Unknown report(s): {', '.join(unknown)}"}, status=404)
+    results = await run_reports_async(names)
+    return _json_response({name: [dict(row._mapping) for row in rows] for name, rows in results.items()})
+
+
+async def report_handler(request):
+    name = request.match_info["name"]
+    if name not in sync_app.REPORT_QUERIES:
+        return _json_response({"error": "Report not found"}, status=404)
+    try:
+        params = sync_app.report_params(name, request.query)
+        tables = sync_app._source_tables(sync_app.REPORT_QUERIES[name](sync_app._reflect_tables(), **params))
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=400)
+    validators = await _table_validators(tables, (name, sorted(params.items())))
+
+    async def build(headers):
+        # asyncpg already prepares and caches statements per connection
+        rows = await run_report_async(name, **params)
+        return _json_response([dict(row._mapping) for row in rows], headers=headers)
+
+    return await _conditional(request, validators, build)
+
+
+# CONDITIONAL GET
+async def _table_validators(names, key):
+    async with async_engine.connect() as conn:
+        rows = (await conn.execute(sync_app._TABLE_VERSIONS_SQL, {"names": list(names)})).all()
+    return sync_app._validators(rows, names, key)
+
+
+def _not_modified(request, etag, last_modified):
+    # same rules as the Flask routes: If-None-Match (weak comparison) wins over If-Modified-Since
+    if request.if_none_match:
+        return any(tag.value in (etag, "*") for tag in request.if_none_match)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+async def _conditional(request, validators, build):
+    # build(headers) makes the full response; the validator headers go on before it is sent
+    etag, last_modified = validators
+    if etag is None:
+        return await build({})
+    headers = {
+        "ETag": f'W/"{etag}"',
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+    if _not_modified(request, etag, last_modified):
+        return web.Response(status=304, headers=headers)
+    return await build(headers)
+
+
+# CRUD
+async def _stream_ndjson(request, table, after, fields=None, where=(), headers=None):
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson", **(headers or {})})
+    await response.prepare(request)
+    async with async_engine.connect() as conn:
+        result = await conn.stream(
+            sync_app._keyset_select(table, after, fields, where),
+            execution_options={"yield_per": sync_app.STREAM_CHUNK_ROWS},
+        )
+        async for rows in result.mappings().partitions():
+            await response.write("".join(_dumps(sync_app._row_to_dict(row, fields)) + "\n" for row in rows).encode())
+    await response.write_eof()
+    return response
+
+
+async def read_records(request):
+    table = sync_app._get_table(request.match_info["table_name"])
+    if table is None:
+        return _json_response({"error": "Table not found"}, status=404)
+
+    try:
+        fields, where = sync_app._read_query(table, request.query)
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=400)
+
+    after = None
+    if request.query.get("after"):
+        try:
+            after = sync_app._decode_cursor(table, request.query["after"])
+        except (ValueError, TypeError):
+            return _json_response({"error": "Invalid cursor"}, status=400)
+
+    limit = None
+    if after is not None or "limit" in request.query:
+        try:
+            limit = int(request.query.get("limit", sync_app.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return _json_response({"error": "Invalid limit"}, status=400)
+        limit = max(1, min(limit, sync_app.MAX_PAGE_SIZE))
+
+    validators = await _table_validators([table.name], ("async", sorted(request.query.items())))
+
+    async def build(headers):
+        return await _read_response(request, table, fields, where, after, limit, headers)
+
+    return await _conditional(request, validators, build)
+
+
+async def _read_response(request, table, fields, where, after, limit, headers):
+    if request.query.get("stream"):
+        return await _stream_ndjson(request, table, after, fields, where, headers)
+
+    if limit is None:
+        async with async_engine.connect() as conn:
+            stmt = select(*sync_app._read_columns(table, fields)).where(*where)
+            result = (await conn.execute(stmt)).mappings().all()
+        return _json_response([sync_app._row_to_dict(row, fields) for row in result], headers=headers)
+
+    async with async_engine.connect() as conn:
+        stmt = sync_app._keyset_select(table, after, fields, where).limit(limit + 1)
+        result = (await conn.execute(stmt)).mappings().all()
+
+    page = result[:limit]
+    headers = dict(headers)
+    if len(result) > limit:
+        next_cursor = sync_app._encode_cursor(table, page[-1])
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.update_query({"limit": limit, "after": next_cursor})}>; rel="next"'
+    return _json_response([sync_app._row_to_dict(row, fields) for row in page], headers=headers)
+
+
+def _coerce_value(column, value):
+    # asyncpg binds Python values as-is, so JSON strings for date/time/numeric
+    # columns become the column's Python type first (psycopg2 leaves that to Postgres)
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type in (datetime.date, datetime.time, datetime.datetime) and isinstance(value, str):
+            return python_type.fromisoformat(value)
+        if python_type is decimal.Decimal and isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            return decimal.Decimal(str(value))
+        if python_type in (int, float) and isinstance(value, str):
+            return python_type(value)
+    except (ValueError, ArithmeticError):
+        raise ValueError(f"invalid {column.name} value")
+    return value
+
+
+def _coerce_row(table, row):
+    return {name: _coerce_value(table.c[name], value) if name in table.c else value for name, value in row.items()}
+
+
+async def _insert_rows(conn, table, columns, chunk, report):
+    # multi-row INSERT ... ON CONFLICT (pk) DO NOTHING per chunk; a failing chunk is
+    # replayed row by row in savepoints so only the bad rows are rejected
+    pk_names = [c.name for c in table.primary_key.columns]
+    with_conflict = all(k in columns for k in pk_names)
+
+    def statement(rows):
+        stmt = insert(table).values([{c: row.get(c) for c in columns} for row in rows])
+        return stmt.on_conflict_do_nothing(index_elements=pk_names) if with_conflict else stmt
+
+    try:
+        async with conn.begin_nested():
+            res = await conn.execute(statement([row for _, row in chunk]))
+        report["inserted"] += res.rowcount
+        report["skipped"] += len(chunk) - res.rowcount
+        return
+    except SQLAlchemyError:
+        pass
+
+    for index, row in chunk:
+        try:
+            async with conn.begin_nested():
+                res = await conn.execute(statement([row]))
+            report["inserted"] += res.rowcount
+            report["skipped"] += 1 - res.rowcount
+        except SQLAlchemyError as e:
+            sync_app._reject(report, index, sync_app._db_error_message(e))
+
+
+async def bulk_insert_async(table, rows, chunk_size=sync_app.BULK_CHUNK_ROWS):
+    report = sync_app._new_bulk_report()
+    check = sync_app._bulk_row_checker(table)
+    async with async_engine.begin() as conn:
+        pending = {}
+        for index, row in enumerate(rows):
+            report["received"] += 1
+            error = check(row)
+            if not error:
+                try:
+                    row = _coerce_row(table, row)
+                except ValueError as e:
+                    error = str(e)
+            if error:
+                sync_app._reject(report, index, error)
+                continue
+            columns = tuple(sorted(row))
+            chunk = pending.setdefault(columns, [])
+            chunk.append((index, row))
+            if len(chunk) >= min(chunk_size, MAX_BIND_PARAMS // max(len(columns), 1)):
+                await _insert_rows(conn, table, columns, chunk, report)
+                pending[columns] = []
+        for columns, chunk in pending.items():
+            if chunk:
+                await _insert_rows(conn, table, columns, chunk, report)
+    if report["inserted"] and table.name == "APPOINTMENT":
+        # months without a partition landed in the default one; the DDL runs on the sync engine
+        await asyncio.to_thread(sync_app.sweep_default_partition, table)
+    return report
+
+
+async def create_record(request):
+    table = sync_app._get_table(request.match_info["table_name"].upper())
+    if table is None:
+        return _json_response({"error": "Table not found"}, status=404)
+    try:
+        data = await request.json() if request.can_read_body else {}
+    except ValueError as e:
+        return _json_response({"error": f"Malformed body: {e}"}, status=400)
+
+    try:
+        if isinstance(data, list):
+            report = await bulk_insert_async(table, data)
+            status = "success" if report["rejected_count"] == 0 else "partial"
+            return _json_response({"status": status, **report})
+        if not isinstance(data, dict):
+            return _json_response({"error": "Malformed body: expected a JSON object or array"}, status=400)
+        try:
+            data = _coerce_row(table, data)
+        except ValueError as e:
+            return _json_response({"error": str(e)}, status=400)
+
+        months = sync_app._appointment_months(table, [data])
+        if months - sync_app._partitions["months"]:
+            # partition DDL runs on the sync engine, off the event loop
+            await asyncio.to_thread(sync_app.ensure_appointment_partitions, months, table)
+        async with async_engine.begin() as conn:
+            stmt = insert(table).values(data)
+            pk_names = [c.name for c in table.primary_key.columns]
+            if all(k in data for k in pk_names):
+                stmt = stmt.on_conflict_do_nothing(index_elements=pk_names)
+            await conn.execute(stmt)
+        return _json_response({"status": "success"})
+    except SQLAlchemyError as e:
+        if sync_app._is_slot_conflict(e):
+            return _json_response({"error": "Caregiver already has an overlapping appointment"}, status=409)
+        return _json_response({"error": str(e)}, status=500)
+
+
+def _parse_pk(table, raw):
+    pk_column = list(table.primary_key.columns)[0]
+    if pk_column.type.python_type == int:
+        return pk_column, int(raw)
+    if pk_column.type.python_type == float:
+        return pk_column, float(raw)
+    return pk_column, raw
+
+
+async def update_record(request):
+    table = sync_app._get_table(request.match_info["table_name"])
+    if table is None:
+        return _json_response({"error": "Table not found"}, status=404)
+    try:
+        pk_column, pk = _parse_pk(table, request.match_info["pk"])
+    except ValueError:
+        return _json_response({"error": "Invalid primary key"}, status=400)
+    try:
+        data = await request.json()
+    except ValueError as e:
+        return _json_response({"error": f"Malformed body: {e}"}, status=400)
+    if not isinstance(data, dict) or not data:
+        return _json_response({"error": "Malformed body: expected a JSON object of columns to change"}, status=400)
+    unknown = set(data) - {c.name for c in sync_app._api_columns(table)}
+    if unknown:
+        return _json_response({"error": f"unknown column(s): {', '.join(sorted(unknown))}"}, status=400)
+    try:
+        data = _coerce_row(table, data)
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=400)
+
+    try:
+        months = sync_app._appointment_months(table, [data])
+        if months - sync_app._partitions["months"]:
+            await asyncio.to_thread(sync_app.ensure_appointment_partitions, months, table)
+        async with async_engine.begin() as conn:
+            result = await conn.execute(update(table).where(pk_column == pk).values(data))
+        if result.rowcount == 0:
+            return _json_response({"error": "Record not found"}, status=404)
+        return _json_response({"status": "updated"})
+    except SQLAlchemyError as e:
+        if sync_app._is_slot_conflict(e):
+            return _json_response({"error": "Caregiver already has an overlapping appointment"}, status=409)
+        return _json_response({"error": str(e)}, status=500)
+
+
+async def delete_record(request):
+    table_name = request.match_info["table_name"]
+    table = sync_app._get_table(table_name.upper())
+    if table is None:
+        return _json_response({"error": f"Table '{table_name}' not found"}, status=404)
+    try:
+        pk_column, record_id = _parse_pk(table, request.match_info["pk"])
+    except ValueError:
+        return _json_response({"error": f"Invalid {list(table.primary_key.columns)[0].name} value"}, status=400)
+    try:
+        async with async_engine.begin() as conn:
+            result = await conn.execute(table.delete().where(pk_column == record_id))
+        if result.rowcount == 0:
+            return _json_response({"error": "Record not found"}, status=404)
+        return _json_response({"message": "Deleted successfully"})
+    except SQLAlchemyError as e:
+        return _json_response({"error": str(e)}, status=500)
+
+
+@web.middleware
+async def cors_middleware(request, handler):
+    # same open CORS policy as flask_cors' CORS(app) on the sync server
+    if request.method == "OPTIONS":
+        response = web.Response()
+        response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+        response.headers["Access-Control-Allow-Headers"] = request.headers.get("Access-Control-Request-Headers", "*")
+    else:
+        response = await handler(request)
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    response.headers["Access-Control-Expose-Headers"] = "X-Next-Cursor, Link, ETag, Last-Modified"
+    return response
+
+
+async def _dispose_engine(application):
+    await async_engine.dispose()
+
+
+def make_app():
+    application = web.Application(middlewares=[cors_middleware])
+    # report routes first: aiohttp matches in registration order
+    application.router.add_get("/reports", reports_handler)
+    application.router.add_get("/reports/{name}", report_handler)
+    application.router.add_get("/{table_name}", read_records)
+    application.router.add_post("/{table_name}", create_record)
+    application.router.add_put("/{table_name}/{pk}", update_record)
+    application.router.add_delete("/{table_name}/{pk}", delete_record)
+    application.on_cleanup.append(_dispose_engine)
+    return application
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the CRUD and report routes on the asyncio engine.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5001)
+    args = parser.parse_args()
+    # schema/seed/sequence checks run once, before the event loop starts serving
+    sync_app.bootstrap()
+    web.run_app(make_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Throughput comparison between the sync Flask server (app.py) and the async
+# server (async_app.py). Both are started as subprocesses on the same database
+# and driven with the same concurrent HTTP load; the 6.x report batch is also
+# timed sequentially (queries_6_x) against concurrently (queries_6_x_async).
+# --serve-workers N adds the pre-forking serve.py mode with N workers.
+#
+#   python bench_async.py --concurrency 64 --duration 10 --output bench_async.json
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+from benchmark import _summarize
+
+DEFAULT_PATHS = ["/USER?limit=100", "/APPOINTMENT?limit=100", "/JOB_APPLICATION?limit=100", "/CAREGIVER?limit=100"]
+
+
+def _wait_for_port(port, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def start_server(kind, port, workers=1):
+    if kind == "sync":
+        code = f"import app; app.app.run(host='127.0.0.1', port={port}, threaded=True)"
+        cmd = [sys.executable, "-c", code]
+    elif kind == "serve":
+        cmd = [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)]
+    else:
+        cmd = [sys.executable, "async_app.py", "--host", "127.0.0.1", "--port", str(port)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_port(port)
+    except RuntimeError:
+        proc.kill()
+        raise
+    return proc
+
+
+async def _load(base_url, paths, concurrency, duration):
+    samples = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def worker(offset):
+            nonlocal errors
+            i = offset
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    async with session.get(base_url + paths[i % len(paths)]) as response:
+                        await response.read()
+                        if response.status >= 400:
+                            errors += 1
+                except aiohttp.ClientError:
+                    errors += 1
+                samples.append(time.perf_counter() - started)
+                i += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    stats = _summarize(samples, errors)
+    stats["requests_per_sec"] = round(len(samples) / elapsed, 1)
+    return stats
+
+
+def bench_http(kind, port, paths, concurrency, duration, workers=1):
+    proc = start_server(kind, port, workers)
+    try:
+        # warm the pools before measuring
+        asyncio.run(_load(f"http://127.0.0.1:{port}", paths, concurrency, 1.0))
+        return asyncio.run(_load(f"http://127.0.0.1:{port}", paths, concurrency, duration))
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def bench_report_batch(repeat):
+    import app
+    import async_app
+
+    def sequential():
+        app.invalidate_reports()
+        app.queries_6_x()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        sequential()
+        samples.append(time.perf_counter() - started)
+    results = {"6.x sequential (sync)": _summarize(samples)}
+
+    async def concurrent():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await async_app.queries_6_x_async()
+            timings.append(time.perf_counter() - started)
+        await async_app.async_engine.dispose()
+        return timings
+
+    results["6.x concurrent (async)"] = _summarize(asyncio.run(concurrent()))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the sync Flask and async serving modes.")
+    parser.add_argument("--sync-port", type=int, default=5101)
+    parser.add_argument("--async-port", type=int, default=5102)
+    parser.add_argument("--serve-port", type=int, default=5103)
+    parser.add_argument("--serve-workers", type=int, default=0, help="also load serve.py with this many workers")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=20, help="iterations of the 6.x report batch")
+    parser.add_argument("--path", action="append", dest="paths", help="GET path to load (repeatable)")
+    parser.add_argument("--output", default="bench_async.json")
+    args = parser.parse_args()
+    paths = args.paths or DEFAULT_PATHS
+
+    results = {}
+    modes = [("sync", args.sync_port), ("async", args.async_port)]
+    if args.serve_workers:
+        modes.append(("serve", args.serve_port))
+    for kind, port in modes:
+        stats = bench_http(kind, port, paths, args.concurrency, args.duration, args.serve_workers)
+        results[f"http {kind}"] = stats
+        print(f"http {kind:<6} {stats['requests_per_sec']:>10} req/s  p50 {stats['p50_ms']:.2f} ms  "
+              f"p95 {stats['p95_ms']:.2f} ms  p99 {stats['p99_ms']:.2f} ms  errors {stats['errors']}")
+
+    for name, stats in bench_report_batch(args.repeat).items():
+        results[name] = stats
+        print(f"{name:<24} p50 {stats['p50_ms']:.2f} ms  p95 {stats['p95_ms']:.2f} ms")
+
+    run = {"concurrency": args.concurrency, "duration": args.duration, "paths": paths, "results": results}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
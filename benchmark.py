@@ -0,0 +1,219 @@
+# Benchmark runner for seed_data, the report queries and the Flask routes.
+# Reports p50/p95/p99 latency and throughput per operation and saves the run
+# as JSON so runs can be compared:
+#
+#   python generate_data.py --users 100000 --out data_100k.json
+#   python benchmark.py --data data_100k.json --reset --output bench_100k.json
+#   python benchmark.py --data data_100k.json --compare bench_100k.json
+#
+# Point DB_URL (or --db-url) at a scratch database: --reset truncates every table.
+import argparse
+import datetime
+import json
+import math
+import os
+import subprocess
+import time
+
+
+def _percentile(sorted_samples, pct):
+    # nearest-rank percentile
+    index = max(0, math.ceil(pct / 100 * len(sorted_samples)) - 1)
+    return sorted_samples[index]
+
+
+def _summarize(samples, errors=0):
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "n": len(ordered),
+        "errors": errors,
+        "mean_ms": round(total / len(ordered) * 1000, 3),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "ops_per_sec": round(len(ordered) / total, 2) if total else None,
+    }
+
+
+def measure(name, fn, repeat, warmup, results):
+    # fn returns False (or an HTTP status >= 400) to count the call as an error
+    for _ in range(warmup):
+        fn()
+    samples = []
+    errors = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outcome = fn()
+        samples.append(time.perf_counter() - started)
+        if outcome is False or (isinstance(outcome, int) and not isinstance(outcome, bool) and outcome >= 400):
+            errors += 1
+    results[name] = _summarize(samples, errors)
+    stats = results[name]
+    print(f"{name:<40} p50 {stats['p50_ms']:>10.3f} ms  p95 {stats['p95_ms']:>10.3f} ms  "
+          f"p99 {stats['p99_ms']:>10.3f} ms  {stats['ops_per_sec']:>10} ops/s"
+          + (f"  errors {errors}" if errors else ""))
+
+
+def _git_rev():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _row_counts(app):
+    from sqlalchemy import text
+    with app.engine.connect() as conn:
+        return {name: conn.execute(text(f'SELECT count(*) FROM "{name}"')).scalar() for name in app.SCHEMA_TABLES}
+
+
+def bench_seed(app, data_path, reset, results):
+    from sqlalchemy import text
+    if reset:
+        with app.engine.begin() as conn:
+            names = ", ".join(f'"{name}"' for name in app.SCHEMA_TABLES)
+            conn.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+        app.invalidate_reports()
+    started = time.perf_counter()
+    summary = app.seed_data(data_path)
+    elapsed = time.perf_counter() - started
+    rows = sum(report["received"] for report in summary.values())
+    results["seed_data"] = {
+        **_summarize([elapsed]),
+        "rows": rows,
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+    }
+    print(f"{'seed_data':<40} {elapsed:.3f} s for {rows} rows ({results['seed_data']['rows_per_sec']} rows/s)")
+
+
+def bench_reports(app, repeat, warmup, results):
+    for name in app.REPORT_QUERIES:
+        scalar = name == "6.3"
+
+        def uncached(name=name, scalar=scalar):
+            app.invalidate_reports()
+            app.run_report(name, scalar=scalar)
+
+        def cached(name=name, scalar=scalar):
+            app.run_report(name, scalar=scalar)
+
+        measure(f"report {name}", uncached, repeat, warmup, results)
+        measure(f"report {name} (cached)", cached, repeat, warmup, results)
+
+
+def bench_routes(app, repeat, warmup, results, full_scans=True):
+    from sqlalchemy import text
+    client = app.app.test_client()
+
+    for name in app.SCHEMA_TABLES:
+        if full_scans:
+            measure(f"GET /{name}", lambda name=name: client.get(f"/{name}").status_code,
+                    repeat, warmup, results)
+        measure(f"GET /{name}?limit=100", lambda name=name: client.get(f"/{name}?limit=100").status_code,
+                repeat, warmup, results)
+
+        def stream(name=name):
+            response = client.get(f"/{name}?stream=1")
+            for _ in response.response:
+                pass
+            return response.status_code
+
+        if full_scans:
+            measure(f"GET /{name}?stream=1", stream, repeat, warmup, results)
+
+    # writes use ids above the current maximum so they never collide with seeded rows
+    with app.engine.connect() as conn:
+        next_id = [(conn.execute(text('SELECT coalesce(max(user_id), 0) FROM "USER"')).scalar() or 0) + 1_000_000]
+
+    def new_user(user_id):
+        return {"user_id": user_id, "email": f"bench{user_id}@example.com", "given_name": "Bench",
+                "surname": "User", "city": "Astana", "password": "bench"}
+
+    def post_one():
+        next_id[0] += 1
+        return client.post("/USER", json=new_user(next_id[0])).status_code
+
+    def post_bulk():
+        rows = []
+        for _ in range(100):
+            next_id[0] += 1
+            rows.append(new_user(next_id[0]))
+        return client.post("/USER", json=rows).status_code
+
+    measure("POST /USER", post_one, repeat, warmup, results)
+    measure("POST /USER (bulk 100)", post_bulk, repeat, warmup, results)
+
+    target = next_id[0]
+    measure("PUT /USER/<pk>", lambda: client.put(f"/USER/{target}", json={"city": "Almaty"}).status_code,
+            repeat, warmup, results)
+
+    delete_ids = list(range(target - repeat - warmup + 1, target + 1))
+
+    def delete_one():
+        return client.delete(f"/USER/{delete_ids.pop()}").status_code
+
+    measure("DELETE /USER/<pk>", delete_one, repeat, warmup, results)
+
+    with app.engine.begin() as conn:
+        conn.execute(text('DELETE FROM "USER" WHERE email LIKE :pattern'), {"pattern": "bench%@example.com"})
+    app.invalidate_reports()
+
+
+def compare(previous_path, results):
+    with open(previous_path, encoding="utf-8") as f:
+        previous = json.load(f)["results"]
+    print(f"\n{'operation':<40} {'old p50':>12} {'new p50':>12} {'speedup':>8}")
+    for name, stats in results.items():
+        if name not in previous:
+            continue
+        old, new = previous[name]["p50_ms"], stats["p50_ms"]
+        speedup = f"{old / new:.2f}x" if new else "-"
+        print(f"{name:<40} {old:>10.3f}ms {new:>10.3f}ms {speedup:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seed_data, the report queries and the Flask routes.")
+    parser.add_argument("--data", default="data.json", help="dataset to seed (see generate_data.py)")
+    parser.add_argument("--db-url", help="overrides DB_URL")
+    parser.add_argument("--reset", action="store_true", help="truncate all tables before seeding")
+    parser.add_argument("--no-seed", action="store_true", help="benchmark the data already in the database")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--skip-full-scans", action="store_true", help="skip unpaged GET /<table> calls")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    if args.db_url:
+        os.environ["DB_URL"] = args.db_url
+    import app
+
+    results = {}
+    if not args.no_seed:
+        bench_seed(app, args.data, args.reset, results)
+    dataset = _row_counts(app)
+    print(f"dataset: {dataset}")
+    bench_reports(app, args.repeat, args.warmup, results)
+    bench_routes(app, args.repeat, args.warmup, results, full_scans=not args.skip_full_scans)
+
+    run = {
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git_rev": _git_rev(),
+        "data": args.data,
+        "dataset": dataset,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2)
+    print(f"\nresults written to {args.output}")
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# Synthetic data generator: writes a data.json-compatible file of any size.
+# Rows are streamed to disk table by table (in foreign-key order, which is
+# also the order seed_data loads them), so memory stays flat even at 10M users.
+#
+#   python generate_data.py --users 100000 --out data_100k.json
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+CITIES = ["Astana", "Almaty", "Shymkent", "Karaganda", "Berlin", "Rome", "Madrid", "Vienna", "Prague", "Lisbon"]
+STREETS = ["Kabanbay Batyr", "Kenesary St", "Abay Ave", "Turan Ave", "Ringstrasse", "Alameda", "Drottninggatan"]
+GIVEN_NAMES = ["Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace", "Henry", "Irene", "Jack", "Aruzhan", "Nursultan"]
+SURNAMES = ["Smith", "Brown", "Taylor", "Wilson", "Johnson", "White", "Harris", "Martin", "Clark", "Lewis", "Sadykova"]
+CAREGIVING_TYPES = ["elderly", "child", "disabled"]
+REQUIREMENTS = ["Must be punctual", "Experience required", "Playful and patient", "Calm demeanor", "soft-spoken",
+                "Certified training", "Friendly and gentle", "Non-smoker"]
+HOUSE_RULES = ["No pets", "No smoking", "Shoes off", "Quiet after 9pm", "No pets. No smoking."]
+DEPENDENTS = ["Elderly father", "Two kids", "Grandmother with limited mobility", "Toddler", "Teenager with autism"]
+STATUSES = ["accepted", "scheduled", "declined", "accepted", "completed"]
+START_DATE = date(2024, 1, 1)
+
+
+def _write_array(out, key, rows, first):
+    # one JSON array per table, one row per line like data.json
+    out.write("" if first else ",\n")
+    out.write(f'"{key}": [\n')
+    count = 0
+    for row in rows:
+        if count:
+            out.write(",\n")
+        out.write(json.dumps(row, ensure_ascii=False))
+        count += 1
+        if count % 100000 == 0:
+            print(f"[gen] {key}: {count} rows")
+    out.write("\n]")
+    return count
+
+
+def generate(out_path, users=10000, caregiver_ratio=0.4, jobs_per_member=1.0,
+             applications_per_job=3.0, appointments_per_member=5.0, seed=42):
+    rng = random.Random(seed)
+    caregiver_ids = []
+    member_ids = []
+    for user_id in range(1, users + 1):
+        (caregiver_ids if rng.random() < caregiver_ratio else member_ids).append(user_id)
+    if not caregiver_ids or not member_ids:
+        raise ValueError("need at least one caregiver and one member; raise --users")
+
+    def users_rows():
+        for user_id in range(1, users + 1):
+            given, surname = rng.choice(GIVEN_NAMES), rng.choice(SURNAMES)
+            # keep the names the mutation helpers look for
+            if user_id == member_ids[0]:
+                given, surname = "Amina", "Aminova"
+            elif user_id == caregiver_ids[0]:
+                given, surname = "Arman", "Armanov"
+            yield {
+                "user_id": user_id,
+                "email": f"user{user_id}@example.com",
+                "given_name": given,
+                "surname": surname,
+                "city": rng.choice(CITIES),
+                "phone_number": f"+7{rng.randrange(10**9, 10**10)}",
+                "profile_description": rng.choice(["Friendly", "Caring", "Patient", "Reliable", "Kind"]),
+                "password": f"pass{rng.randrange(1000, 9999)}",
+            }
+
+    def caregiver_rows():
+        for user_id in caregiver_ids:
+            yield {
+                "caregiver_user_id": user_id,
+                "photo": f"photo{user_id}.jpg",
+                "gender": rng.choice(["Male", "Female"]),
+                "caregiving_type": rng.choice(CAREGIVING_TYPES),
+                "hourly_rate": round(rng.uniform(7, 25), 2),
+            }
+
+    def member_rows():
+        for user_id in member_ids:
+            yield {
+                "member_user_id": user_id,
+                "house_rules": rng.choice(HOUSE_RULES),
+                "dependent_description": rng.choice(DEPENDENTS),
+            }
+
+    def address_rows():
+        for user_id in member_ids:
+            yield {
+                "member_user_id": user_id,
+                "house_number": str(rng.randrange(1, 200)),
+                "street": rng.choice(STREETS),
+                "town": rng.choice(CITIES),
+            }
+
+    job_count = int(len(member_ids) * jobs_per_member)
+
+    def job_rows():
+        for job_id in range(1, job_count + 1):
+            yield {
+                "job_id": job_id,
+                "member_user_id": rng.choice(member_ids),
+                "required_caregiving_type": rng.choice(CAREGIVING_TYPES),
+                "other_requirements": rng.choice(REQUIREMENTS),
+                "date_posted": (START_DATE + timedelta(days=rng.randrange(700))).isoformat(),
+            }
+
+    def application_rows():
+        # (caregiver, job) is the primary key, so sample distinct caregivers per job
+        for job_id in range(1, job_count + 1):
+            count = min(len(caregiver_ids), int(rng.expovariate(1 / applications_per_job)))
+            for caregiver_id in rng.sample(caregiver_ids, count):
+                yield {
+                    "caregiver_user_id": caregiver_id,
+                    "job_id": job_id,
+                    "date_applied": (START_DATE + timedelta(days=rng.randrange(700))).isoformat(),
+                }
+
+    appointment_count = int(len(member_ids) * appointments_per_member)
+
+    def appointment_rows():
+        for appointment_id in range(1, appointment_count + 1):
+            yield {
+                "appointment_id": appointment_id,
+                "caregiver_user_id": rng.choice(caregiver_ids),
+                "member_user_id": rng.choice(member_ids),
+                "appointment_date": (START_DATE + timedelta(days=rng.randrange(700))).isoformat(),
+                "appointment_time": f"{rng.randrange(7, 20):02d}:{rng.choice(['00', '30'])}",
+                "work_hours": rng.randrange(1, 9),
+                "status": rng.choice(STATUSES),
+            }
+
+    started = time.perf_counter()
+    counts = {}
+    with open(out_path, "w", encoding="utf-8") as out:
+        out.write("{\n")
+        for first, (key, rows) in enumerate([
+            ("users", users_rows()),
+            ("caregivers", caregiver_rows()),
+            ("members", member_rows()),
+            ("addresses", address_rows()),
+            ("jobs", job_rows()),
+            ("job_applications", application_rows()),
+            ("appointments", appointment_rows()),
+        ]):
+            counts[key] = _write_array(out, key, rows, first == 0)
+        out.write("\n}\n")
+    print(f"[gen] wrote {out_path} in {time.perf_counter() - started:.1f}s: {counts}")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a data.json-compatible synthetic dataset.")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--caregiver-ratio", type=float, default=0.4)
+    parser.add_argument("--jobs-per-member", type=float, default=1.0)
+    parser.add_argument("--applications-per-job", type=float, default=3.0)
+    parser.add_argument("--appointments-per-member", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="data_generated.json")
+    args = parser.parse_args()
+    generate(
+        args.out, users=args.users, caregiver_ratio=args.caregiver_ratio,
+        jobs_per_member=args.jobs_per_member, applications_per_job=args.applications_per_job,
+        appointments_per_member=args.appointments_per_member, seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Production serving mode: app.py's Flask routes behind a pre-forking server,
+# separate from the interactive CLI in app.py's __main__.
+#
+#   python serve.py --workers 4 --port 5000 --pool-size 5 --max-overflow 5 --statement-timeout 30000
+#
+# The master binds the listening socket and runs bootstrap() once, then forks
+# the workers. Each worker drops the connection pool it inherited and serves the
+# shared socket with a thread per request, so throughput scales with cores while
+# every worker holds at most pool_size + max_overflow connections. SIGTERM or
+# SIGINT stops accepting, lets in-flight requests finish for up to
+# --graceful-timeout seconds, then exits; a worker that dies is replaced.
+import argparse
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+RESPAWN_DELAY = 1.0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve the Flask routes with pre-forked worker processes.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--backlog", type=int, default=1024)
+    parser.add_argument("--pool-size", type=int, default=int(os.environ.get("DB_POOL_SIZE", "5")),
+                        help="pooled connections per worker")
+    parser.add_argument("--max-overflow", type=int, default=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+                        help="extra connections per worker under load")
+    parser.add_argument("--statement-timeout", type=int,
+                        default=int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "0")),
+                        help="statement_timeout in milliseconds for the workers' connections (0 = none)")
+    parser.add_argument("--graceful-timeout", type=float, default=30.0,
+                        help="seconds in-flight requests get to finish on shutdown")
+    return parser.parse_args()
+
+
+def run_worker(sock, args):
+    import app
+    from werkzeug.serving import make_server
+
+    app.reset_after_fork()
+    server = make_server(args.host, args.port, app.app, threaded=True, fd=sock.fileno())
+    # every worker wakes on a new connection but only one accept() wins; the rest
+    # must return to the select loop (and see shutdown) instead of blocking in accept()
+    server.socket.setblocking(False)
+    # track request threads so server_close() waits for them on shutdown
+    server.daemon_threads = False
+
+    def stop(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so not from this (the serving) thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    server.serve_forever()
+    server.server_close()
+    app.engine.dispose()
+
+
+def spawn(sock, args):
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            run_worker(sock, args)
+        except BaseException:
+            import traceback
+            traceback.print_exc()
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def main():
+    args = parse_args()
+    # app reads its pool settings at import
+    os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(args.max_overflow)
+    os.environ["DB_STATEMENT_TIMEOUT_MS"] = str(args.statement_timeout)
+    if args.workers > 1:
+        # a worker's report cache does not see the other workers' writes
+        os.environ["REPORT_CACHE_VERIFY"] = "1"
+    import app
+
+    # once, in the master, instead of racing in every worker; then close the
+    # master's connections so no worker inherits a socket it shares
+    app.bootstrap()
+    app.engine.dispose()
+
+    sock = socket.create_server((args.host, args.port), backlog=args.backlog)
+    sock.set_inheritable(True)
+    workers = {spawn(sock, args) for _ in range(args.workers)}
+    print(f"[serve] {len(workers)} worker(s) on http://{args.host}:{args.port} (pid {os.getpid()})")
+
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+    signal.signal(signal.SIGINT, lambda signum, frame: stopping.append(signum))
+
+    while not stopping:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            pid, status = 0, 0
+        if pid and pid in workers:
+            workers.discard(pid)
+            if not stopping:
+                print(f"[serve] worker {pid} exited with status {status}; replacing it")
+                time.sleep(RESPAWN_DELAY)
+                workers.add(spawn(sock, args))
+            continue
+        time.sleep(0.2)
+
+    print(f"[serve] shutting down {len(workers)} worker(s)")
+    sock.close()
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    deadline = time.monotonic() + args.graceful_timeout
+    while workers and time.monotonic() < deadline:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            workers.discard(pid)
+        else:
+            time.sleep(0.1)
+    for pid in workers:
+        # still busy past the deadline (e.g. an open SSE stream)
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    print("[serve] stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
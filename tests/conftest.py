@@ -0,0 +1,16 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import app as sync_app
+
+
+@pytest.fixture(scope="session")
+def database():
+    # the tests write through the real schema; without a reachable DB_URL they are skipped
+    try:
+        with sync_app.engine.connect():
+            pass
+    except OperationalError:
+        pytest.skip("database at DB_URL is not reachable")
+    sync_app.bootstrap()
+    return sync_app.engine
@@ -0,0 +1,111 @@
+import asyncio
+import datetime
+import decimal
+
+from aiohttp.test_utils import TestClient, TestServer
+from sqlalchemy import text
+
+import async_app
+
+MARKER = "async-test"
+
+
+def _request(method, path, **kwargs):
+    async def go():
+        async with TestClient(TestServer(async_app.make_app())) as client:
+            response = await client.request(method, path, **kwargs)
+            return response.status, await response.json()
+    return asyncio.run(go())
+
+
+def _cleanup(database):
+    with database.begin() as conn:
+        conn.execute(text('DELETE FROM "APPOINTMENT" WHERE status = :marker'), {"marker": MARKER})
+        conn.execute(text('DELETE FROM "JOB" WHERE other_requirements = :marker'), {"marker": MARKER})
+
+
+def test_post_job_with_date(database):
+    _cleanup(database)
+    status, body = _request("POST", "/JOB", json={
+        "member_user_id": 2, "other_requirements": MARKER, "date_posted": "2025-01-01",
+    })
+    assert status == 200, body
+    with database.connect() as conn:
+        posted = conn.execute(
+            text('SELECT date_posted FROM "JOB" WHERE other_requirements = :marker'), {"marker": MARKER}
+        ).scalar()
+    assert posted == datetime.date(2025, 1, 1)
+    _cleanup(database)
+
+
+def test_bulk_post_appointments_with_dates(database):
+    _cleanup(database)
+    rows = [
+        {"caregiver_user_id": 1, "member_user_id": 2, "appointment_date": "2031-03-02",
+         "appointment_time": "10:00", "work_hours": "2.5", "status": MARKER},
+        {"caregiver_user_id": 1, "member_user_id": 2, "appointment_date": "2031-03-03",
+         "appointment_time": "11:30:00", "work_hours": 3, "status": MARKER},
+        {"caregiver_user_id": 1, "member_user_id": 2, "appointment_date": "not-a-date",
+         "appointment_time": "10:00", "status": MARKER},
+    ]
+    status, body = _request("POST", "/APPOINTMENT", json=rows)
+    assert status == 200, body
+    assert body["inserted"] == 2
+    assert body["rejected"] == [{"row": 2, "error": "invalid appointment_date value"}]
+    with database.connect() as conn:
+        stored = conn.execute(text(
+            'SELECT appointment_date, appointment_time, work_hours FROM "APPOINTMENT" '
+            "WHERE status = :marker ORDER BY appointment_date"
+        ), {"marker": MARKER}).all()
+    assert [tuple(row) for row in stored] == [
+        (datetime.date(2031, 3, 2), datetime.time(10, 0), decimal.Decimal("2.50")),
+        (datetime.date(2031, 3, 3), datetime.time(11, 30), decimal.Decimal("3.00")),
+    ]
+    _cleanup(database)
+
+
+def _insert_appointment(database, day, time="09:00"):
+    with database.begin() as conn:
+        return conn.execute(text(
+            'INSERT INTO "APPOINTMENT" (caregiver_user_id, member_user_id, appointment_date, appointment_time, '
+            "work_hours, status) VALUES (1, 2, :day, :time, 2, :marker) RETURNING appointment_id"
+        ), {"day": day, "time": time, "marker": MARKER}).scalar()
+
+
+def test_put_appointment_date(database):
+    _cleanup(database)
+    appointment_id = _insert_appointment(database, datetime.date(2031, 4, 1))
+    status, body = _request("PUT", f"/APPOINTMENT/{appointment_id}", json={
+        "appointment_date": "2031-04-02", "appointment_time": "12:15",
+    })
+    assert status == 200, body
+    with database.connect() as conn:
+        row = conn.execute(text(
+            'SELECT appointment_date, appointment_time FROM "APPOINTMENT" WHERE appointment_id = :id'
+        ), {"id": appointment_id}).one()
+    assert tuple(row) == (datetime.date(2031, 4, 2), datetime.time(12, 15))
+    _cleanup(database)
+
+
+def test_put_rejects_bad_requests(database):
+    _cleanup(database)
+    appointment_id = _insert_appointment(database, datetime.date(2031, 4, 1))
+    status, body = _request("PUT", f"/APPOINTMENT/{appointment_id}", data="{not json",
+                            headers={"Content-Type": "application/json"})
+    assert status == 400 and "Malformed body" in body["error"]
+    status, body = _request("PUT", f"/APPOINTMENT/{appointment_id}", json={"no_such_column": 1})
+    assert (status, body) == (400, {"error": "unknown column(s): no_such_column"})
+    status, body = _request("PUT", f"/APPOINTMENT/{appointment_id}", json={"appointment_date": "someday"})
+    assert (status, body) == (400, {"error": "invalid appointment_date value"})
+    status, body = _request("PUT", "/APPOINTMENT/999999999", json={"work_hours": 1})
+    assert (status, body) == (404, {"error": "Record not found"})
+    _cleanup(database)
+
+
+def test_put_overlapping_slot_is_a_conflict(database):
+    _cleanup(database)
+    _insert_appointment(database, datetime.date(2031, 5, 1), "09:00")
+    later = _insert_appointment(database, datetime.date(2031, 5, 1), "12:00")
+    status, body = _request("PUT", f"/APPOINTMENT/{later}", json={"appointment_time": "10:00"})
+    assert status == 409, body
+    _cleanup(database)
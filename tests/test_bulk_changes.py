@@ -0,0 +1,60 @@
+import datetime
+
+import pytest
+from sqlalchemy import text
+
+import app as sync_app
+
+MARKER = "bulk-test"
+
+
+@pytest.fixture
+def appointments(database):
+    # two appointments in different months, so different partitions
+    def cleanup():
+        with database.begin() as conn:
+            conn.execute(text('DELETE FROM "APPOINTMENT" WHERE status = :marker'), {"marker": MARKER})
+
+    cleanup()
+    with database.begin() as conn:
+        ids = conn.execute(text(
+            'INSERT INTO "APPOINTMENT" (caregiver_user_id, member_user_id, appointment_date, appointment_time, '
+            "work_hours, status) VALUES (1, 2, '2031-06-01', '09:00', 2, :marker), "
+            "(1, 2, '2031-07-01', '09:00', 2, :marker) RETURNING appointment_id"
+        ), {"marker": MARKER}).scalars().all()
+    yield ids
+    cleanup()
+
+
+def test_bulk_patch_appointments_by_bare_id(appointments):
+    client = sync_app.app.test_client()
+    first, second = appointments
+    response = client.patch("/APPOINTMENT", json=[
+        {"appointment_id": first, "work_hours": 3},
+        {"appointment_id": second, "appointment_date": "2031-07-02"},
+    ])
+    body = response.get_json()
+    assert response.status_code == 200, body
+    assert (body["affected"], body["rejected_count"]) == (2, 0)
+    assert body["results"][0]["key"] == {"appointment_id": first}
+    with sync_app.engine.connect() as conn:
+        rows = dict(conn.execute(text(
+            'SELECT appointment_id, (work_hours, appointment_date)::text FROM "APPOINTMENT" '
+            "WHERE appointment_id = ANY(:ids)"
+        ), {"ids": appointments}).all())
+    assert rows[first] == "(3.00,2031-06-01)"
+    assert rows[second] == f"(2.00,{datetime.date(2031, 7, 2)})"
+
+
+def test_bulk_delete_appointments_by_bare_id(appointments):
+    client = sync_app.app.test_client()
+    missing = max(appointments) + 1000000
+    response = client.delete("/APPOINTMENT", json=appointments + [missing])
+    body = response.get_json()
+    assert response.status_code == 200, body
+    assert (body["affected"], body["not_found"], body["rejected_count"]) == (2, 1, 0)
+    with sync_app.engine.connect() as conn:
+        left = conn.execute(text(
+            'SELECT count(*) FROM "APPOINTMENT" WHERE appointment_id = ANY(:ids)'
+        ), {"ids": appointments}).scalar()
+    assert left == 0